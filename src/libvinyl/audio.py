@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-import struct
+import functools
+import os
 import wave
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
 import numpy as np
-from scipy.signal import medfilt
+from scipy.ndimage import median_filter
 
 
 @dataclass
@@ -47,6 +49,67 @@ class TrackSegment:
         return self.end_sec - self.start_sec
 
 
+_MAX_SAMPLE_VALUE = {2: 32768.0, 3: 8388608.0, 4: 2147483648.0}
+
+
+def _decode_samples(raw: np.ndarray, sample_width: int, n_channels: int) -> np.ndarray:
+    """Decode little-endian PCM bytes into signed integers, one row per frame.
+
+    `raw` is a flat uint8 array of whole frames. Only the first two channels
+    are decoded — multi-channel WAVs from the TP-7 carry the stereo pair in
+    channels 1+2 with the rest unused.
+    """
+    if sample_width == 2:
+        return raw.view("<i2").reshape(-1, n_channels)[:, :2]
+    if sample_width == 3:
+        b = raw.reshape(-1, n_channels, 3)[:, :2]
+        # Casting the high byte through int8 sign-extends without branching
+        return (
+            b[..., 0].astype(np.int32)
+            | (b[..., 1].astype(np.int32) << 8)
+            | (b[..., 2].astype(np.int8).astype(np.int32) << 16)
+        )
+    if sample_width == 4:
+        return raw.view("<i4").reshape(-1, n_channels)[:, :2]
+    raise ValueError(f"Unsupported sample width: {sample_width}")
+
+
+def _wav_data_offset(path: Path) -> int:
+    """Return the byte offset of the sample data in a WAV file."""
+    with open(path, "rb") as f:
+        header = f.read(12)
+        if header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+            raise wave.Error(f"Not a WAVE file: {path}")
+        while True:
+            chunk = f.read(8)
+            if len(chunk) < 8:
+                raise wave.Error(f"No data chunk in {path}")
+            size = int.from_bytes(chunk[4:], "little")
+            if chunk[:4] == b"data":
+                return f.tell()
+            # Chunks are word-aligned
+            f.seek(size + (size & 1), 1)
+
+
+def _map_wav_frames(path: Path, n_frames: int, frame_bytes: int) -> np.ndarray:
+    """Memory-map a WAV file's sample data as a flat uint8 array.
+
+    Pages come straight from the OS cache, avoiding the bytes copy that
+    wave.readframes makes. A truncated data chunk maps only whole frames
+    that are actually present.
+    """
+    offset = _wav_data_offset(path)
+    available = (path.stat().st_size - offset) // frame_bytes
+    n_bytes = min(n_frames, available) * frame_bytes
+    if n_bytes <= 0:
+        return np.empty(0, dtype=np.uint8)
+    return np.memmap(path, dtype=np.uint8, mode="r", offset=offset, shape=(n_bytes,))
+
+
+# Audio decoded per block in read_wav_mono_rms
+_RMS_BLOCK_SEC = 10.0
+
+
 def read_wav_mono_rms(path: Path, window_sec: float = 0.1) -> tuple[np.ndarray, int]:
     """Read a WAV file and compute RMS energy in sliding windows.
 
@@ -58,49 +121,45 @@ def read_wav_mono_rms(path: Path, window_sec: float = 0.1) -> tuple[np.ndarray,
         sample_rate = wf.getframerate()
         n_frames = wf.getnframes()
 
-        # Read in chunks to avoid loading entire file into memory at once
+        if sample_width not in _MAX_SAMPLE_VALUE:
+            raise ValueError(f"Unsupported sample width: {sample_width}")
+        max_val = _MAX_SAMPLE_VALUE[sample_width]
+
         window_frames = int(sample_rate * window_sec)
-        rms_values = []
-
-        frames_read = 0
-        while frames_read < n_frames:
-            chunk_size = min(window_frames, n_frames - frames_read)
-            raw = wf.readframes(chunk_size)
-            frames_read += chunk_size
-
-            # Convert raw bytes to numpy array
-            if sample_width == 2:
-                fmt = f"<{chunk_size * n_channels}h"
-                max_val = 32768.0
-            elif sample_width == 3:
-                # 24-bit: unpack manually
-                samples = []
-                for i in range(0, len(raw), 3):
-                    b = raw[i : i + 3]
-                    val = struct.unpack("<i", b + (b"\xff" if b[2] & 0x80 else b"\x00"))[0]
-                    samples.append(val)
-                arr = np.array(samples, dtype=np.float64)
-                max_val = 8388608.0
-                if n_channels > 1:
-                    arr = arr.reshape(-1, n_channels)[:, :2].mean(axis=1)
-                rms = np.sqrt(np.mean((arr / max_val) ** 2))
-                rms_values.append(rms)
-                continue
-            elif sample_width == 4:
-                fmt = f"<{chunk_size * n_channels}i"
-                max_val = 2147483648.0
-            else:
-                raise ValueError(f"Unsupported sample width: {sample_width}")
 
-            if sample_width != 3:
-                samples_data = struct.unpack(fmt, raw)
-                arr = np.array(samples_data, dtype=np.float64)
-                if n_channels > 1:
-                    arr = arr.reshape(-1, n_channels)[:, :2].mean(axis=1)
-                rms = np.sqrt(np.mean((arr / max_val) ** 2))
-                rms_values.append(rms)
+    frame_bytes = n_channels * sample_width
+    raw = _map_wav_frames(path, n_frames, frame_bytes)
+    total_frames = len(raw) // frame_bytes
+    rms = np.empty(-(-total_frames // window_frames), dtype=np.float32)
+    scale = np.float32(1.0 / (max_val * min(n_channels, 2)))
+
+    # Decode a bounded block of whole windows at a time, so the working
+    # arrays stay a few MB however long the side is
+    block_frames = window_frames * max(1, int(_RMS_BLOCK_SEC / window_sec))
+    for start in range(0, total_frames, block_frames):
+        block = raw[start * frame_bytes : (start + block_frames) * frame_bytes]
+
+        # Mix to mono, normalise and square in place on one float32 buffer —
+        # float32 is ample for relative loudness and halves the memory traffic
+        samples = _decode_samples(block, sample_width, n_channels)
+        power = samples[:, 0].astype(np.float32)
+        if samples.shape[1] > 1:
+            power += samples[:, 1]
+        power *= scale
+        np.square(power, out=power)
+
+        # Mean power per window; only the last block can end in a partial one
+        first = start // window_frames
+        n_full = len(power) // window_frames
+        split = n_full * window_frames
+        np.sqrt(
+            power[:split].reshape(n_full, window_frames).mean(axis=1),
+            out=rms[first : first + n_full],
+        )
+        if split < len(power):
+            rms[first + n_full] = np.sqrt(power[split:].mean())
 
-    return np.array(rms_values), sample_rate
+    return rms, sample_rate
 
 
 def detect_silences(
@@ -117,48 +176,42 @@ def detect_silences(
     """
     # Smooth the RMS curve
     if len(rms) > median_filter_size:
-        smoothed = medfilt(rms, kernel_size=median_filter_size)
+        # Zero padding at the edges matches scipy.signal.medfilt
+        smoothed = median_filter(rms, size=median_filter_size, mode="constant")
     else:
         smoothed = rms
 
-    median_rms = np.median(rms[rms > 0]) if np.any(rms > 0) else 0.001
+    nonzero = rms[rms > 0]
+    median_rms = np.median(nonzero) if len(nonzero) else 0.001
     threshold = threshold_factor * median_rms
 
     min_silence_windows = int(min_silence_sec / window_sec)
 
-    # Find runs of silence
+    # Find runs of silence from the rising/falling edges of the mask
     is_silent = smoothed < threshold
-    gaps: list[SilenceGap] = []
-    in_silence = False
-    start_idx = 0
-
-    for i, silent in enumerate(is_silent):
-        if silent and not in_silence:
-            in_silence = True
-            start_idx = i
-        elif not silent and in_silence:
-            in_silence = False
-            length = i - start_idx
-            if length >= min_silence_windows:
-                gaps.append(SilenceGap(
-                    start_sec=start_idx * window_sec,
-                    end_sec=i * window_sec,
-                ))
-
-    # Handle trailing silence
-    if in_silence:
-        length = len(is_silent) - start_idx
-        if length >= min_silence_windows:
-            gaps.append(SilenceGap(
-                start_sec=start_idx * window_sec,
-                end_sec=len(is_silent) * window_sec,
-            ))
-
+    edges = np.diff(is_silent.astype(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    keep = (ends - starts) >= min_silence_windows
+
+    gaps = [
+        SilenceGap(start_sec=int(start) * window_sec, end_sec=int(end) * window_sec)
+        for start, end in zip(starts[keep], ends[keep])
+    ]
     return gaps
 
 
 def get_wav_duration(path: Path) -> float:
-    """Get the duration of a WAV file in seconds."""
+    """Get the duration of a WAV file in seconds.
+
+    Durations are cached per file and re-read if the file is modified.
+    """
+    st = path.stat()
+    return _read_wav_duration(path, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=256)
+def _read_wav_duration(path: Path, mtime_ns: int, size: int) -> float:
     with wave.open(str(path), "rb") as wf:
         return wf.getnframes() / wf.getframerate()
 
@@ -172,17 +225,33 @@ class _FileRMS:
     window_sec: float
     global_offset: float  # start time relative to album start
 
+    @functools.cached_property
+    def rms_prefix(self) -> np.ndarray:
+        """Prefix sum of rms (with a leading zero), shared by window searches."""
+        return np.concatenate(([0.0], np.cumsum(self.rms, dtype=np.float64)))
+
 
 def _load_file_rms_data(
     wav_files: list[Path],
     window_sec: float = 0.05,
 ) -> list[_FileRMS]:
-    """Load RMS data for all files with global offset tracking."""
+    """Load RMS data for all files with global offset tracking.
+
+    Files are decoded concurrently; wave I/O and the NumPy reductions
+    release the GIL, so threads overlap reads with computation.
+    """
+    if not wav_files:
+        return []
+
+    durations = [get_wav_duration(f) for f in wav_files]
+    with ThreadPoolExecutor(max_workers=min(8, len(wav_files))) as pool:
+        rms_arrays = list(pool.map(
+            lambda f: read_wav_mono_rms(f, window_sec=window_sec)[0], wav_files,
+        ))
+
     result = []
     offset = 0.0
-    for f in wav_files:
-        dur = get_wav_duration(f)
-        rms, _sr = read_wav_mono_rms(f, window_sec=window_sec)
+    for f, dur, rms in zip(wav_files, durations, rms_arrays):
         result.append(_FileRMS(
             path=f, duration=dur, rms=rms,
             window_sec=window_sec, global_offset=offset,
@@ -191,6 +260,16 @@ def _load_file_rms_data(
     return result
 
 
+def _window_sums(prefix: np.ndarray, width: int) -> np.ndarray:
+    """Sum every run of `width` consecutive values, given their prefix sum.
+
+    Returns len(prefix) - width sums (empty if there are too few values).
+    """
+    if len(prefix) <= width:
+        return np.empty(0)
+    return prefix[width:] - prefix[:-width]
+
+
 def _find_quietest_region(
     fd: _FileRMS,
     local_time: float,
@@ -211,20 +290,16 @@ def _find_quietest_region(
     if start_idx >= end_idx or start_idx >= len(fd.rms):
         return local_time
 
-    rms_slice = fd.rms[start_idx:end_idx]
+    # Slice the file's precomputed prefix sum rather than re-summing
+    prefix = fd.rms_prefix[start_idx : end_idx + 1]
     region_windows = max(1, int(region_sec / fd.window_sec))
 
-    best_energy = float("inf")
-    best_time = local_time
+    if len(prefix) <= region_windows:
+        return local_time
 
-    for i in range(len(rms_slice) - region_windows + 1):
-        region_energy = np.mean(rms_slice[i : i + region_windows])
-        if region_energy < best_energy:
-            best_energy = region_energy
-            mid_idx = i + region_windows // 2
-            best_time = (start_idx + mid_idx) * fd.window_sec
+    best = int(np.argmin(_window_sums(prefix, region_windows)))
 
-    return best_time
+    return (start_idx + best + region_windows // 2) * fd.window_sec
 
 
 def _detect_music_region(
@@ -250,17 +325,17 @@ def _detect_music_region(
     threshold = threshold_factor * median_rms
     sustain_windows = max(1, int(sustain_sec / fd.window_sec))
 
-    music_start = 0.0
-    for i in range(len(rms) - sustain_windows + 1):
-        if float(np.mean(rms[i : i + sustain_windows])) >= threshold:
-            music_start = max(0.0, i * fd.window_sec - 1.0)
-            break
+    # Every sustain-length window whose mean energy reaches the threshold
+    sustain_means = _window_sums(fd.rms_prefix, sustain_windows) / sustain_windows
+    loud = np.flatnonzero(sustain_means >= threshold)
 
+    music_start = 0.0
     music_end = fd.duration
-    for i in range(len(rms) - sustain_windows, -1, -1):
-        if float(np.mean(rms[i : i + sustain_windows])) >= threshold:
-            music_end = min((i + sustain_windows) * fd.window_sec + 1.0, fd.duration)
-            break
+    if len(loud):
+        music_start = max(0.0, int(loud[0]) * fd.window_sec - 1.0)
+        music_end = min(
+            (int(loud[-1]) + sustain_windows) * fd.window_sec + 1.0, fd.duration,
+        )
 
     return music_start, music_end
 
@@ -278,6 +353,10 @@ def _assign_tracks_to_files(
     n_files = len(file_music_durations)
     n_tracks = len(track_durations)
 
+    # ends[i] is the total duration of tracks 0..i-1, so a group of
+    # tracks [a, b) lasts ends[b] - ends[a]
+    ends = np.concatenate(([0.0], np.cumsum(track_durations, dtype=np.float64)))
+
     groups: list[list[int]] = [[] for _ in range(n_files)]
     track_idx = 0
 
@@ -287,18 +366,20 @@ def _assign_tracks_to_files(
             break
 
         target = file_music_durations[file_idx]
-        cumulative = 0.0
         best_split = track_idx
         best_diff = target
 
-        for i in range(track_idx, n_tracks):
-            cumulative += track_durations[i]
-            diff = abs(cumulative - target)
+        # The best fit is one of the two split points either side of the
+        # target; for the lower one, prefer the earliest of any equal ends
+        above = int(np.searchsorted(ends, ends[track_idx] + target))
+        below = int(np.searchsorted(ends, ends[max(above - 1, 0)]))
+        for split in (below, above):
+            if not track_idx < split <= n_tracks:
+                continue
+            diff = abs((ends[split] - ends[track_idx]) - target)
             if diff < best_diff:
                 best_diff = diff
-                best_split = i + 1
-            if cumulative > target * 1.5:
-                break
+                best_split = split
 
         groups[file_idx] = list(range(track_idx, best_split))
         track_idx = best_split
@@ -326,16 +407,14 @@ def analyze_album_files(
     if not wav_files:
         return []
 
-    file_durations = [(f, get_wav_duration(f)) for f in wav_files]
-
     # If files already match expected track count, assume 1:1 mapping
     if expected_tracks and len(wav_files) == expected_tracks:
-        segments = []
-        for i, (f, dur) in enumerate(file_durations, 1):
-            segments.append(TrackSegment(
-                source_file=f, start_sec=0, end_sec=dur, track_number=i,
-            ))
-        return segments
+        return [
+            TrackSegment(
+                source_file=f, start_sec=0, end_sec=get_wav_duration(f), track_number=i,
+            )
+            for i, f in enumerate(wav_files, 1)
+        ]
 
     # Duration-first approach when we have MusicBrainz data
     has_durations = (
@@ -348,6 +427,7 @@ def analyze_album_files(
         )
 
     # Fallback: simple silence detection (for manual mode)
+    file_durations = [(f, get_wav_duration(f)) for f in wav_files]
     return _analyze_silence_fallback(wav_files, file_durations, window_sec)
 
 
@@ -364,10 +444,20 @@ def _analyze_duration_first(
       1. Detects the music region in each file (skipping lead-in/lead-out)
       2. Assigns tracks to files based on cumulative duration fit
       3. Finds track boundaries within each file independently
+
+    If the expected durations already tile the files exactly, the tracks
+    are laid end to end without reading any audio.
     """
-    file_data = _load_file_rms_data(wav_files, window_sec=window_sec)
     durations_sec = [d / 1000.0 for d in expected_durations_ms]
 
+    exact = _exact_fit_segments(
+        wav_files, [get_wav_duration(f) for f in wav_files], durations_sec,
+    )
+    if exact is not None:
+        return exact
+
+    file_data = _load_file_rms_data(wav_files, window_sec=window_sec)
+
     music_regions = [_detect_music_region(fd) for fd in file_data]
     music_durations = [end - start for start, end in music_regions]
     track_groups = _assign_tracks_to_files(music_durations, durations_sec)
@@ -410,6 +500,56 @@ def _analyze_duration_first(
     return segments
 
 
+def _exact_fit_segments(
+    wav_files: list[Path],
+    file_durations: list[float],
+    durations_sec: list[float],
+    tolerance: float = 0.5,
+) -> list[TrackSegment] | None:
+    """Lay tracks end to end when their durations fit the files exactly.
+
+    Applies only when the total expected duration matches the audio to
+    within tolerance and every file boundary lands on a track boundary,
+    i.e. there is no lead-in, lead-out or gap to search for. Returns None
+    otherwise, so the caller falls back to the RMS-based search.
+    """
+    if not durations_sec:
+        return None
+
+    track_ends = np.cumsum(durations_sec)
+    file_ends = np.cumsum(file_durations)
+    if abs(track_ends[-1] - file_ends[-1]) >= tolerance:
+        return None
+
+    # Index of the track that ends nearest each file's end
+    last_tracks = np.abs(track_ends[None, :] - file_ends[:, None]).argmin(axis=1)
+    if (
+        np.any(np.abs(track_ends[last_tracks] - file_ends) >= tolerance)
+        or np.any(np.diff(last_tracks) <= 0)
+        or last_tracks[-1] != len(durations_sec) - 1
+    ):
+        return None
+
+    segments: list[TrackSegment] = []
+    first = 0
+    for f, file_dur, file_end, last in zip(
+        wav_files, file_durations, file_ends, last_tracks,
+    ):
+        file_start = file_end - file_dur
+        for i in range(first, int(last) + 1):
+            start = 0.0 if i == first else float(track_ends[i - 1] - file_start)
+            end = file_dur if i == last else float(track_ends[i] - file_start)
+            segments.append(TrackSegment(
+                source_file=f,
+                start_sec=min(max(start, 0.0), file_dur),
+                end_sec=min(max(end, 0.0), file_dur),
+                track_number=i + 1,
+            ))
+        first = int(last) + 1
+
+    return segments
+
+
 def _analyze_silence_fallback(
     wav_files: list[Path],
     file_durations: list[tuple[Path, float]],
@@ -459,22 +599,38 @@ def split_wav(
     start_sec: float,
     end_sec: float,
 ) -> None:
-    """Extract a segment from a WAV file and write it to a new file."""
+    """Extract a segment from a WAV file and write it to a new file.
+
+    The source's sample data is memory-mapped, so the segment is written
+    straight from the pages that analysis already pulled into the OS cache
+    without being copied into Python memory. The output is written to a
+    temporary file and renamed into place, so it never truncates a file
+    that is still mapped, whether by this call or by a concurrent split.
+    """
+    if output.resolve() == source.resolve():
+        raise ValueError(f"Refusing to split {source.name} onto itself")
+
     with wave.open(str(source), "rb") as wf:
-        params = wf.getparams()
         sample_rate = wf.getframerate()
         n_channels = wf.getnchannels()
         sample_width = wf.getsampwidth()
+        n_frames = wf.getnframes()
 
         start_frame = int(start_sec * sample_rate)
-        end_frame = int(end_sec * sample_rate)
-        n_frames = end_frame - start_frame
-
-        wf.setpos(start_frame)
-        raw_data = wf.readframes(n_frames)
-
-    with wave.open(str(output), "wb") as out_wf:
-        out_wf.setnchannels(n_channels)
-        out_wf.setsampwidth(sample_width)
-        out_wf.setframerate(sample_rate)
-        out_wf.writeframes(raw_data)
+        end_frame = max(start_frame, int(end_sec * sample_rate))
+        wf.setpos(start_frame)  # validates the start position
+
+    frame_bytes = n_channels * sample_width
+    data = _map_wav_frames(source, n_frames, frame_bytes)
+
+    tmp_output = output.with_name(output.name + ".tmp")
+    try:
+        with wave.open(str(tmp_output), "wb") as out_wf:
+            out_wf.setnchannels(n_channels)
+            out_wf.setsampwidth(sample_width)
+            out_wf.setframerate(sample_rate)
+            out_wf.writeframes(data[start_frame * frame_bytes : end_frame * frame_bytes])
+        os.replace(tmp_output, output)
+    except BaseException:
+        tmp_output.unlink(missing_ok=True)
+        raise
@@ -4,14 +4,16 @@ from __future__ import annotations
 
 import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import click
+import numpy as np
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from . import ui
 from .audio import TrackSegment, analyze_album_files, get_wav_duration, split_wav
-from .convert import tag_flac, wav_to_flac
+from .convert import batch_wav_to_flac, track_tags
 from .musicbrainz import get_release_tracks, search_releases
 from .state import AlbumState, AlbumStatus, StateManager, TrackInfo
 from .visualise import visualise_splits
@@ -60,25 +62,32 @@ def process_album(
 
     ui.print_header(f"Processing: {folder_name}")
 
+    # State is saved after every stage so an interrupted run can resume
+    # from the last completed stage.
+
     # Stage: RAW → ANALYZED (MusicBrainz lookup)
     if album_state.status == AlbumStatus.RAW:
         album_state = _stage_analyze(album_state, folder_name)
         state_mgr.set_album(folder_name, album_state)
+        state_mgr.save()
 
     # Stage: ANALYZED → SPLIT
     if album_state.status == AlbumStatus.ANALYZED:
         album_state = _stage_split(album_state, album_dir, folder_name)
         state_mgr.set_album(folder_name, album_state)
+        state_mgr.save()
 
     # Stage: SPLIT → CONVERTED
     if album_state.status == AlbumStatus.SPLIT:
         album_state = _stage_convert(album_state, album_dir, folder_name)
         state_mgr.set_album(folder_name, album_state)
+        state_mgr.save()
 
     # Stage: CONVERTED → DONE (archive originals)
     if album_state.status == AlbumStatus.CONVERTED:
         album_state = _stage_archive(album_state, album_dir, library_path, folder_name)
         state_mgr.set_album(folder_name, album_state)
+        state_mgr.save()
 
     if album_state.status == AlbumStatus.DONE:
         ui.print_success(f"Album complete: {folder_name}")
@@ -192,7 +201,7 @@ def _stage_split(
         # Detect short segments
         if segments:
             durations = [s.duration_sec for s in segments]
-            median_dur = sorted(durations)[len(durations) // 2]
+            median_dur = float(np.median(durations))
             delete_indices = ui.show_short_segments(segments, track_names, median_dur)
 
         # Show waveform visualisation before removing dropped segments
@@ -232,6 +241,25 @@ def _stage_split(
         if i < len(track_names):
             seg.track_name = track_names[i]
 
+    pad = len(str(len(segments)))
+    outputs: list[tuple[TrackSegment, Path]] = []
+    if not files_match_tracks:
+        # A re-run after an interrupted split can pick up earlier outputs as
+        # sources; never overwrite a pending source. Checked before any
+        # further prompts, since it depends only on the segments and names.
+        for seg in segments:
+            track_name = sanitize_filename(seg.track_name or f"Track {seg.track_number}")
+            outputs.append((seg, album_dir / f"{seg.track_number:0{pad}d} - {track_name}.wav"))
+        sources = {seg.source_file.resolve() for seg in segments}
+        clashes = sorted(path.name for _, path in outputs if path.resolve() in sources)
+        if clashes:
+            ui.print_error(
+                "Split output would overwrite a source recording: "
+                + ", ".join(clashes)
+            )
+            ui.print_warning("Skipping album.")
+            return album_state
+
     # Ask for quality
     quality = ui.prompt_quality()
     album_state.quality = quality
@@ -250,7 +278,6 @@ def _stage_split(
     original_files = [f.name for f in wav_files]
 
     # Do the splitting
-    pad = len(str(len(segments)))
     if files_match_tracks:
         # Just rename in place — files already correspond 1:1
         for seg in segments:
@@ -269,13 +296,28 @@ def _stage_split(
             console=ui.console,
         ) as progress:
             task = progress.add_task("Splitting audio...", total=len(segments))
-            for seg in segments:
-                track_name = sanitize_filename(seg.track_name or f"Track {seg.track_number}")
-                new_name = f"{seg.track_number:0{pad}d} - {track_name}.wav"
-                output_path = album_dir / new_name
-                split_wav(seg.source_file, output_path, seg.start_sec, seg.end_sec)
-                seg.source_file = output_path
-                progress.advance(task)
+            # Segments are independent byte ranges, so overlap their I/O
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                futures = {}
+                for seg, output_path in outputs:
+                    future = pool.submit(
+                        split_wav, seg.source_file, output_path, seg.start_sec, seg.end_sec,
+                    )
+                    futures[future] = (seg, output_path)
+
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                        seg, output_path = futures[future]
+                        seg.source_file = output_path
+                        progress.advance(task)
+                except BaseException:
+                    # Skip queued splits, wait for running ones, then remove
+                    # this run's outputs so a re-run sees only the originals
+                    pool.shutdown(cancel_futures=True)
+                    for _, output_path in outputs:
+                        output_path.unlink(missing_ok=True)
+                    raise
 
     # Update state
     album_state.tracks = [
@@ -309,6 +351,9 @@ def _stage_convert(
         task = progress.add_task("Converting...", total=total_tracks)
 
         pad = len(str(total_tracks))
+        # Queue conversions first, then run them side by side
+        jobs: list[tuple[Path, Path, bool, dict[str, str]]] = []
+        pending: dict[Path, TrackInfo] = {}
         for track in album_state.tracks:
             safe_name = sanitize_filename(track.name)
             wav_name = track.file or f"{track.number:0{pad}d} - {safe_name}.wav"
@@ -334,9 +379,8 @@ def _stage_convert(
                 progress.advance(task)
                 continue
 
-            wav_to_flac(wav_path, flac_path, hi_res=hi_res)
-            tag_flac(
-                flac_path,
+            pending[flac_path] = track
+            tags = track_tags(
                 track_number=track.number,
                 track_title=track.name,
                 artist=album_state.artist,
@@ -345,9 +389,17 @@ def _stage_convert(
                 genre=album_state.genre,
                 total_tracks=total_tracks,
             )
-            track.file = flac_name
+            jobs.append((wav_path, flac_path, hi_res, tags))
+
+        # Each FLAC is tagged before it appears, so a failure part-way
+        # leaves only complete files for the next run to skip
+        for _ in batch_wav_to_flac(jobs):
             progress.advance(task)
 
+        # Point tracks at their FLACs only once every conversion succeeded
+        for flac_path, track in pending.items():
+            track.file = flac_path.name
+
     album_state.status = AlbumStatus.CONVERTED
     return album_state
 
@@ -410,41 +462,40 @@ def process(
 ) -> None:
     """Process albums: analyse, split, convert to FLAC, and archive."""
     library_path = library_path.resolve()
-    state_mgr = StateManager(library_path)
-
-    if album:
-        folder = album
-        if not (library_path / folder).is_dir():
-            ui.print_error(f"Album folder not found: {folder}")
-            raise SystemExit(1)
-        process_album(library_path, folder, state_mgr)
-    else:
-        folders = state_mgr.discover_albums()
-        if not folders:
-            ui.print_warning("No album folders found.")
-            return
-
-        ui.print_info(f"Found {len(folders)} album(s) in library.")
-
-        # Show current state
-        all_states = {}
-        for f in folders:
-            existing = state_mgr.get_album(f)
-            if existing:
-                all_states[f] = existing
-            else:
-                artist, album_name = parse_folder_name(f)
-                all_states[f] = AlbumState(artist=artist, album=album_name)
-
-        ui.print_status_table(all_states)
-
-        # Process albums that aren't done
-        for folder in folders:
-            existing = state_mgr.get_album(folder)
-            if existing and existing.status == AlbumStatus.DONE:
-                continue
-            ui.console.print()
+    with StateManager(library_path) as state_mgr:
+        if album:
+            folder = album
+            if not (library_path / folder).is_dir():
+                ui.print_error(f"Album folder not found: {folder}")
+                raise SystemExit(1)
             process_album(library_path, folder, state_mgr)
+        else:
+            folders = state_mgr.discover_albums()
+            if not folders:
+                ui.print_warning("No album folders found.")
+                return
+
+            ui.print_info(f"Found {len(folders)} album(s) in library.")
+
+            # Show current state
+            all_states = {}
+            for f in folders:
+                existing = state_mgr.get_album(f)
+                if existing:
+                    all_states[f] = existing
+                else:
+                    artist, album_name = parse_folder_name(f)
+                    all_states[f] = AlbumState(artist=artist, album=album_name)
+
+            ui.print_status_table(all_states)
+
+            # Process albums that aren't done
+            for folder in folders:
+                existing = state_mgr.get_album(folder)
+                if existing and existing.status == AlbumStatus.DONE:
+                    continue
+                ui.console.print()
+                process_album(library_path, folder, state_mgr)
 
 
 @main.command()
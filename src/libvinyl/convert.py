@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import os
 import subprocess
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from mutagen.flac import FLAC
@@ -17,18 +20,62 @@ def wav_to_flac(
 
     If hi_res is False, downsample to 44.1kHz/16-bit (CD quality).
     """
-    cmd = ["ffmpeg", "-y", "-i", str(wav_path)]
+    # Errors only: keeps stderr to a few lines we can still surface on failure
+    cmd = ["ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error", "-y", "-i", str(wav_path)]
     # Extract only the first two channels (stereo) — multi-channel WAVs
     # from the TP-7 have the stereo pair in channels 1+2 with the rest unused.
     cmd.extend(["-af", "pan=stereo|c0=c0|c1=c1"])
     if not hi_res:
         cmd.extend(["-ar", "44100", "-sample_fmt", "s16"])
-    cmd.extend(["-c:a", "flac", str(flac_path)])
-    subprocess.run(cmd, check=True, capture_output=True)
+    # Explicit muxer, so the output name needn't end in .flac
+    cmd.extend(["-c:a", "flac", "-f", "flac", str(flac_path)])
+    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
 
 
-def tag_flac(
+def wav_to_tagged_flac(
+    wav_path: Path,
     flac_path: Path,
+    hi_res: bool,
+    tags: dict[str, str],
+) -> None:
+    """Convert a WAV file to FLAC and tag it before it appears at flac_path.
+
+    The FLAC is encoded and tagged under a temporary name, then renamed into
+    place, so an existing flac_path is always a complete, tagged file.
+    """
+    tmp_path = flac_path.with_name(flac_path.name + ".tmp")
+    try:
+        wav_to_flac(wav_path, tmp_path, hi_res=hi_res)
+        _write_tags(tmp_path, tags)
+        os.replace(tmp_path, flac_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def batch_wav_to_flac(
+    jobs: Iterable[tuple[Path, Path, bool, dict[str, str]]],
+) -> Iterator[tuple[Path, Path, bool, dict[str, str]]]:
+    """Convert and tag (wav_path, flac_path, hi_res, tags) jobs concurrently.
+
+    Yields each job as its tagged FLAC is in place. The encoding happens in
+    separate ffmpeg processes, so threads are enough to keep every core busy.
+    If a conversion fails, queued jobs are cancelled and the error is raised
+    once the running ones finish.
+    """
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        futures = {pool.submit(wav_to_tagged_flac, *job): job for job in jobs}
+        try:
+            for future in as_completed(futures):
+                future.result()
+                yield futures[future]
+        except BaseException:
+            # Also reached when the caller abandons the generator
+            pool.shutdown(cancel_futures=True)
+            raise
+
+
+def track_tags(
     track_number: int,
     track_title: str,
     artist: str,
@@ -36,17 +83,41 @@ def tag_flac(
     year: str | None = None,
     genre: str | None = None,
     total_tracks: int | None = None,
-) -> None:
-    """Write metadata tags to a FLAC file."""
-    audio = FLAC(str(flac_path))
-    audio["title"] = track_title
-    audio["artist"] = artist
-    audio["album"] = album
-    audio["tracknumber"] = str(track_number)
+) -> dict[str, str]:
+    """Build the Vorbis comment tags for one track."""
+    tags = {
+        "title": track_title,
+        "artist": artist,
+        "album": album,
+        "tracknumber": str(track_number),
+    }
     if total_tracks:
-        audio["tracktotal"] = str(total_tracks)
+        tags["tracktotal"] = str(total_tracks)
     if year:
-        audio["date"] = year
+        tags["date"] = year
     if genre:
-        audio["genre"] = genre
+        tags["genre"] = genre
+    return tags
+
+
+def _write_tags(flac_path: Path, tags: dict[str, str]) -> None:
+    audio = FLAC(str(flac_path))
+    audio.update(tags)
     audio.save()
+
+
+def tag_flac(
+    flac_path: Path,
+    track_number: int,
+    track_title: str,
+    artist: str,
+    album: str,
+    year: str | None = None,
+    genre: str | None = None,
+    total_tracks: int | None = None,
+) -> None:
+    """Write metadata tags to a FLAC file."""
+    _write_tags(
+        flac_path,
+        track_tags(track_number, track_title, artist, album, year, genre, total_tracks),
+    )
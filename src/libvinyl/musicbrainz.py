@@ -2,11 +2,71 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import time
 from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
 
-import musicbrainzngs
+_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "libvinyl" / "musicbrainz"
+)
+_CACHE_TTL_SEC = 7 * 24 * 60 * 60
+_response_cache: dict[str, dict] = {}
+_musicbrainzngs: ModuleType | None = None
 
-musicbrainzngs.set_useragent("libvinyl", "0.1.0", "https://github.com/nickrw/libvinyl")
+
+def _mb() -> ModuleType:
+    """Import and configure musicbrainzngs on first use.
+
+    Commands that never query MusicBrainz (e.g. status) skip the import.
+    """
+    global _musicbrainzngs
+    if _musicbrainzngs is None:
+        import musicbrainzngs
+
+        musicbrainzngs.set_useragent("libvinyl", "0.1.0", "https://github.com/nickrw/libvinyl")
+        _musicbrainzngs = musicbrainzngs
+    return _musicbrainzngs
+
+
+def _cached_call(func_name: str, **kwargs: object) -> dict:
+    """Call a musicbrainzngs lookup by name, caching its raw response.
+
+    Responses are kept in memory for the life of the process and on disk
+    for a week, so repeated lookups skip the rate-limited web service.
+    The cache is best-effort: unreadable or unwritable entries are ignored.
+    """
+    key = hashlib.sha256(
+        json.dumps([func_name, kwargs], sort_keys=True).encode()
+    ).hexdigest()
+    if key in _response_cache:
+        return _response_cache[key]
+
+    cache_file = _CACHE_DIR / f"{key}.json"
+    try:
+        if time.time() - cache_file.stat().st_mtime < _CACHE_TTL_SEC:
+            with open(cache_file, "rb") as f:
+                result = json.load(f)
+            _response_cache[key] = result
+            return result
+    except (OSError, ValueError):
+        pass
+
+    result = getattr(_mb(), func_name)(**kwargs)
+    _response_cache[key] = result
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(".tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(result, f)
+        os.replace(tmp_file, cache_file)
+    except (OSError, TypeError):
+        pass
+    return result
 
 
 @dataclass
@@ -40,6 +100,21 @@ class MBRelease:
         return " ".join(parts)
 
 
+def _flatten_artist_credit(credit: list[dict | str]) -> str:
+    """Join an artist-credit list into a display name.
+
+    Credits alternate between artist dicts and join phrases such as " & ".
+    """
+    parts: list[str] = []
+    append = parts.append
+    for c in credit:
+        if isinstance(c, dict):
+            append(c.get("name", c.get("artist", {}).get("name", "")))
+        else:
+            append(c)
+    return "".join(parts)
+
+
 def _parse_release_list(release_list: list[dict]) -> list[MBRelease]:
     """Parse a list of raw release dicts into MBRelease objects."""
     releases = []
@@ -49,13 +124,7 @@ def _parse_release_list(release_list: list[dict]) -> list[MBRelease]:
         year = None
         if "date" in rel:
             year = rel["date"][:4] if len(rel["date"]) >= 4 else rel["date"]
-        artist_name = ""
-        if "artist-credit" in rel:
-            artist_name = "".join(
-                c.get("name", c.get("artist", {}).get("name", ""))
-                if isinstance(c, dict) else c
-                for c in rel["artist-credit"]
-            )
+        artist_name = _flatten_artist_credit(rel.get("artist-credit", []))
         track_count = 0
         medium_format = None
         for medium in rel.get("medium-list", []):
@@ -82,8 +151,9 @@ def search_releases(artist: str, album: str, limit: int = 20, offset: int = 0) -
 
     Returns (releases, total_count) so callers can paginate.
     """
-    result = musicbrainzngs.search_releases(
-        artist=artist, release=album, limit=limit, offset=offset
+    result = _cached_call(
+        "search_releases",
+        artist=artist, release=album, limit=limit, offset=offset,
     )
     release_list = result.get("release-list", [])
     total = int(result.get("release-count", 0))
@@ -92,8 +162,9 @@ def search_releases(artist: str, album: str, limit: int = 20, offset: int = 0) -
 
 def get_release_tracks(release_id: str) -> MBRelease:
     """Fetch full track listing for a specific release."""
-    result = musicbrainzngs.get_release_by_id(
-        release_id, includes=["recordings", "artists", "tags"]
+    result = _cached_call(
+        "get_release_by_id",
+        id=release_id, includes=["recordings", "artists", "tags"],
     )
     rel = result["release"]
 
@@ -102,20 +173,17 @@ def get_release_tracks(release_id: str) -> MBRelease:
     if "date" in rel:
         year = rel["date"][:4] if len(rel["date"]) >= 4 else rel["date"]
 
-    artist_name = ""
-    if "artist-credit" in rel:
-        artist_name = "".join(
-            c.get("name", c.get("artist", {}).get("name", ""))
-            if isinstance(c, dict) else c
-            for c in rel["artist-credit"]
-        )
+    artist_name = _flatten_artist_credit(rel.get("artist-credit", []))
 
     # Collect tags as genre
     tags = rel.get("tag-list", [])
 
     tracks: list[MBTrack] = []
     track_num = 1
+    medium_format = None
     for medium in rel.get("medium-list", []):
+        if medium_format is None and "format" in medium:
+            medium_format = medium["format"]
         for track in medium.get("track-list", []):
             recording = track.get("recording", {})
             duration = None
@@ -130,12 +198,6 @@ def get_release_tracks(release_id: str) -> MBRelease:
             ))
             track_num += 1
 
-    medium_format = None
-    for medium in rel.get("medium-list", []):
-        if "format" in medium:
-            medium_format = medium["format"]
-            break
-
     return MBRelease(
         id=release_id,
         title=title,
@@ -5,12 +5,21 @@ Tracks per-album processing state in a YAML file at the library root.
 
 from __future__ import annotations
 
+import copy
+import json
+import os
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
 
 import yaml
 
+# Prefer the libyaml-backed C implementations when PyYAML was built with them
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class AlbumStatus(str, Enum):
     RAW = "raw"
@@ -21,14 +30,16 @@ class AlbumStatus(str, Enum):
 
     @property
     def next(self) -> AlbumStatus | None:
-        order = list(AlbumStatus)
-        idx = order.index(self)
-        if idx + 1 < len(order):
-            return order[idx + 1]
-        return None
+        return _NEXT_STATUS[self]
+
 
+_STATUS_ORDER = list(AlbumStatus)
+_NEXT_STATUS: dict[AlbumStatus, AlbumStatus | None] = dict(
+    zip(_STATUS_ORDER, [*_STATUS_ORDER[1:], None])
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class TrackInfo:
     number: int
     name: str
@@ -51,7 +62,7 @@ class TrackInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AlbumState:
     status: AlbumStatus = AlbumStatus.RAW
     artist: str = ""
@@ -64,23 +75,21 @@ class AlbumState:
     original_files: list[str] = field(default_factory=list)
 
     def to_dict(self) -> dict:
-        d: dict = {
+        optional = {
+            "musicbrainz_id": self.musicbrainz_id,
+            "year": self.year,
+            "genre": self.genre,
+            "tracks": [t.to_dict() for t in self.tracks],
+            "original_files": self.original_files,
+        }
+        # Identity fields are always written; the rest only when set
+        return {
             "status": self.status.value,
             "artist": self.artist,
             "album": self.album,
             "quality": self.quality,
+            **{k: v for k, v in optional.items() if v},
         }
-        if self.musicbrainz_id:
-            d["musicbrainz_id"] = self.musicbrainz_id
-        if self.year:
-            d["year"] = self.year
-        if self.genre:
-            d["genre"] = self.genre
-        if self.tracks:
-            d["tracks"] = [t.to_dict() for t in self.tracks]
-        if self.original_files:
-            d["original_files"] = self.original_files
-        return d
 
     @classmethod
     def from_dict(cls, d: dict) -> AlbumState:
@@ -97,46 +106,148 @@ class AlbumState:
         )
 
 
+# Parsed state keyed by (path, mtime_ns, size), so re-opening an unchanged
+# state file copies the albums instead of parsing the YAML again.
+_PARSE_CACHE: dict[tuple[str, int, int], dict[str, AlbumState]] = {}
+_PARSE_CACHE_SIZE = 16
+
+
+def _parse_cache_key(path: Path) -> tuple[str, int, int]:
+    st = path.stat()
+    return str(path), st.st_mtime_ns, st.st_size
+
+
+def _remember_parsed(key: tuple[str, int, int], state: dict[str, AlbumState]) -> None:
+    _PARSE_CACHE.pop(key, None)
+    _PARSE_CACHE[key] = copy.deepcopy(state)
+    while len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+        del _PARSE_CACHE[next(iter(_PARSE_CACHE))]
+
+
+def _read_json_cache(cache_file: Path, stamp: tuple[int, int]) -> dict | None:
+    """Return the cached albums mapping if it was built from this YAML stamp."""
+    try:
+        with open(cache_file, "rb") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("source") != list(stamp):
+        return None
+    return cached.get("albums")
+
+
+def _write_json_cache(cache_file: Path, stamp: tuple[int, int], albums: dict) -> None:
+    """Best-effort JSON copy of the parsed state, tagged with the YAML stamp."""
+    tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+    try:
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({"source": list(stamp), "albums": albums}, f, ensure_ascii=False)
+        os.replace(tmp_file, cache_file)
+    except (OSError, TypeError, ValueError):
+        # Hand-edited YAML can hold values JSON can't encode (e.g. dates)
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+
+
 class StateManager:
     def __init__(self, library_path: Path):
         self.library_path = library_path
         self.state_file = library_path / "library-state.yaml"
-        self._state: dict[str, AlbumState] = {}
+        # JSON mirror of the YAML, which loads far faster in a new process
+        self.cache_file = library_path / ".library-state.cache.json"
+        self._state: dict[str, AlbumState] = {}  # sorted by folder name
+        self._dirty = False
         self._load()
 
+    def __enter__(self) -> StateManager:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.save()
+
     def _load(self) -> None:
         if self.state_file.exists():
-            with open(self.state_file) as f:
-                data = yaml.safe_load(f) or {}
-            albums = data.get("albums", {})
-            for folder_name, album_data in albums.items():
+            key = _parse_cache_key(self.state_file)
+            cached = _PARSE_CACHE.get(key)
+            if cached is not None:
+                self._state = copy.deepcopy(cached)
+                return
+
+            stamp = key[1:]
+            albums = _read_json_cache(self.cache_file, stamp)
+            if albums is None:
+                with open(self.state_file, "rb") as f:
+                    data = yaml.load(f, Loader=_Loader) or {}
+                albums = data.get("albums", {})
+                _write_json_cache(self.cache_file, stamp, albums)
+            for folder_name, album_data in sorted(albums.items()):
                 self._state[folder_name] = AlbumState.from_dict(album_data)
+            _remember_parsed(key, self._state)
 
-    def save(self) -> None:
+    def save(self, force: bool = False) -> None:
+        """Write the state file if any album changed since the last save.
+
+        The file is written alongside and renamed into place, so an
+        interrupted save never leaves a truncated state file behind.
+        """
+        if not self._dirty and not force:
+            return
         data = {
             "albums": {
-                name: state.to_dict() for name, state in sorted(self._state.items())
+                name: state.to_dict() for name, state in self._state.items()
             }
         }
-        with open(self.state_file, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        tmp_file = self.state_file.with_name(self.state_file.name + ".tmp")
+        # Binary streams let libyaml read and emit UTF-8 bytes directly
+        with open(tmp_file, "wb") as f:
+            yaml.dump(
+                data, f, Dumper=_Dumper, encoding="utf-8",
+                default_flow_style=False, sort_keys=False, allow_unicode=True,
+            )
+        os.replace(tmp_file, self.state_file)
+        self._dirty = False
+        key = _parse_cache_key(self.state_file)
+        _write_json_cache(self.cache_file, key[1:], data["albums"])
+        _remember_parsed(key, self._state)
 
     def get_album(self, folder_name: str) -> AlbumState | None:
         return self._state.get(folder_name)
 
     def set_album(self, folder_name: str, state: AlbumState) -> None:
+        is_new = folder_name not in self._state
         self._state[folder_name] = state
-        self.save()
-
-    def all_albums(self) -> dict[str, AlbumState]:
-        return dict(self._state)
+        if is_new:
+            # Keep albums in folder order so save() needn't sort them.
+            # Re-sort in place so views from all_albums() stay live.
+            ordered = sorted(self._state.items())
+            self._state.clear()
+            self._state.update(ordered)
+        self._dirty = True
+
+    def all_albums(self) -> Mapping[str, AlbumState]:
+        """Read-only live view of every album; copy it with dict() to mutate."""
+        return MappingProxyType(self._state)
+
+    def discover_album_entries(self) -> list[os.DirEntry[str]]:
+        """Find all non-hidden album folders, as scandir entries sorted by name.
+
+        Callers that need more than the name can use the entry's path and
+        its cached stat results instead of looking the folder up again.
+        """
+        # scandir's DirEntry.is_dir() uses the type from the directory
+        # listing, avoiding a stat per entry
+        with os.scandir(self.library_path) as it:
+            entries = [
+                entry for entry in it
+                if entry.is_dir()
+                and not entry.name.startswith(".")
+                and entry.name != "archive"
+            ]
+        entries.sort(key=lambda entry: entry.name)
+        return entries
 
     def discover_albums(self) -> list[str]:
         """Find all album folders in the library that aren't hidden."""
-        folders = []
-        for entry in sorted(self.library_path.iterdir()):
-            if entry.is_dir() and not entry.name.startswith("."):
-                if entry.name == "archive":
-                    continue
-                folders.append(entry.name)
-        return folders
+        return [entry.name for entry in self.discover_album_entries()]
@@ -16,6 +16,14 @@ if TYPE_CHECKING:
 
 console = Console()
 
+_STATUS_STYLES = {
+    "raw": "red",
+    "analyzed": "yellow",
+    "split": "blue",
+    "converted": "magenta",
+    "done": "green",
+}
+
 
 def print_status_table(albums: dict[str, AlbumState]) -> None:
     """Print a status overview of all albums."""
@@ -28,13 +36,7 @@ def print_status_table(albums: dict[str, AlbumState]) -> None:
     table.add_column("Tracks", justify="right")
 
     for i, (folder, state) in enumerate(sorted(albums.items()), 1):
-        status_style = {
-            "raw": "red",
-            "analyzed": "yellow",
-            "split": "blue",
-            "converted": "magenta",
-            "done": "green",
-        }.get(state.status.value, "white")
+        status_style = _STATUS_STYLES.get(state.status.value, "white")
 
         table.add_row(
             str(i),
@@ -63,39 +65,40 @@ def pick_release(
         console.print("[yellow]No releases found on MusicBrainz.[/yellow]")
         return None
 
-    _print_release_table(releases)
+    while True:
+        _print_release_table(releases)
 
-    has_more = total > len(releases)
-    if has_more:
-        console.print(
-            f"[dim]Showing {len(releases)} of {total} results. "
-            f"Enter -1 to load more.[/dim]"
-        )
-    console.print("[dim]Enter 0 to skip MusicBrainz and enter track info manually.[/dim]")
+        has_more = total > len(releases)
+        if has_more:
+            console.print(
+                f"[dim]Showing {len(releases)} of {total} results. "
+                f"Enter -1 to load more.[/dim]"
+            )
+        console.print("[dim]Enter 0 to skip MusicBrainz and enter track info manually.[/dim]")
 
-    default = _suggest_default(releases)
+        default = _suggest_default(releases)
 
-    choice = IntPrompt.ask("Select release", default=default)
+        choice = IntPrompt.ask("Select release", default=default)
 
-    if choice == 0:
-        return None
-    if choice == -1 and has_more:
-        from .musicbrainz import search_releases
+        if choice == 0:
+            return None
+        if choice == -1 and has_more:
+            from .musicbrainz import search_releases
 
-        try:
-            more, total = search_releases(
-                artist, album, limit=20, offset=len(releases)
-            )
-        except Exception as e:
-            console.print(f"[red]Failed to fetch more results: {e}[/red]")
-            return pick_release(releases, len(releases), artist, album)
-        releases.extend(more)
-        return pick_release(releases, total, artist, album)
-    if 1 <= choice <= len(releases):
-        return releases[choice - 1]
+            try:
+                more, total = search_releases(
+                    artist, album, limit=20, offset=len(releases)
+                )
+            except Exception as e:
+                console.print(f"[red]Failed to fetch more results: {e}[/red]")
+                total = len(releases)
+                continue
+            releases.extend(more)
+            continue
+        if 1 <= choice <= len(releases):
+            return releases[choice - 1]
 
-    console.print("[red]Invalid choice.[/red]")
-    return pick_release(releases, total, artist, album)
+        console.print("[red]Invalid choice.[/red]")
 
 
 def _print_release_table(releases: list[MBRelease]) -> None:
@@ -125,19 +128,24 @@ def _print_release_table(releases: list[MBRelease]) -> None:
 
 def _suggest_default(releases: list[MBRelease]) -> int:
     """Suggest a default release: prefer GB vinyl, then any vinyl, then first."""
-    vinyl_indices = [
-        i for i, rel in enumerate(releases, 1)
-        if rel.format and "vinyl" in rel.format.lower()
-    ]
-    gb_vinyl_indices = [
-        i for i in vinyl_indices
-        if releases[i - 1].country and releases[i - 1].country.upper() == "GB"
-    ]
-    if len(gb_vinyl_indices) == 1:
-        default = gb_vinyl_indices[0]
+    vinyl_count = gb_vinyl_count = 0
+    vinyl_first = gb_vinyl_first = 0
+    for i, rel in enumerate(releases, 1):
+        if not (rel.format and "vinyl" in rel.format.lower()):
+            continue
+        vinyl_count += 1
+        vinyl_first = vinyl_first or i
+        if rel.country and rel.country.upper() == "GB":
+            gb_vinyl_count += 1
+            gb_vinyl_first = gb_vinyl_first or i
+            if gb_vinyl_count > 1:
+                # Two GB vinyls imply two vinyls: neither can be unique
+                break
+    if gb_vinyl_count == 1:
+        default = gb_vinyl_first
         console.print(f"[dim]One GB Vinyl release found (#{default}).[/dim]")
-    elif len(vinyl_indices) == 1:
-        default = vinyl_indices[0]
+    elif vinyl_count == 1:
+        default = vinyl_first
         console.print(f"[dim]One Vinyl release found (#{default}).[/dim]")
     else:
         default = 1